@@ -4,6 +4,12 @@ import altair as alt
 import time
 import matplotlib.pyplot as plt
 
+# Opsional: input "as-you-type" dengan debounce (pip install streamlit-keyup)
+try:
+    from st_keyup import st_keyup
+except ImportError:
+    st_keyup = None
+
 # Import modul logika (Pastikan file inference.py ada di folder yang sama)
 import inference
 
@@ -326,9 +332,18 @@ elif selected_page == "Uji Coba Model (Live)":
 
     with col_input:
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        user_input = st.text_area("Masukkan Ulasan Pengguna:", height=150, placeholder="Contoh: Aplikasinya bagus banget, dokter ramah tapi obatnya agak mahal...")
-        
-        analyze_btn = st.button("🔍 Analisis Sentimen")
+        live_mode = st.toggle("⚡ Mode Ketik Langsung (As-you-type)", value=False, disabled=st_keyup is None)
+        if st_keyup is None:
+            st.caption("Install `streamlit-keyup` untuk mengaktifkan mode ketik langsung.")
+
+        if live_mode:
+            # Debounce: prediksi hanya dikirim setelah user berhenti mengetik.
+            # Rerun baru otomatis menghentikan rerun lama, sehingga request basi dibatalkan.
+            user_input = st_keyup("Masukkan Ulasan Pengguna:", debounce=300, key="live_keyup", placeholder="Contoh: Aplikasinya bagus banget, dokter ramah tapi obatnya agak mahal...")
+            analyze_btn = bool(user_input)
+        else:
+            user_input = st.text_area("Masukkan Ulasan Pengguna:", height=150, placeholder="Contoh: Aplikasinya bagus banget, dokter ramah tapi obatnya agak mahal...")
+            analyze_btn = st.button("🔍 Analisis Sentimen")
         st.markdown('</div>', unsafe_allow_html=True)
 
     with col_result:
@@ -336,9 +351,9 @@ elif selected_page == "Uji Coba Model (Live)":
             if not inference.MODEL_LOADED:
                 st.error("Model belum siap. Cek log error.")
             else:
-                with st.spinner('Sedang memproses dengan IndoBERT...'):
-                    time.sleep(0.5)
-                    label, confidence, probs = inference.predict_sentiment(user_input)
+                start_time = time.perf_counter()
+                label, confidence, probs = inference.predict_sentiment(user_input)
+                latency_ms = (time.perf_counter() - start_time) * 1000
                 
                 color_map = {'Positif': '#4CAF50', 'Netral': '#FFC107', 'Negatif': '#F44336'}
                 result_color = color_map.get(label, '#ffffff')
@@ -348,6 +363,7 @@ elif selected_page == "Uji Coba Model (Live)":
                     <h3 style="margin-bottom: 0;">Hasil Prediksi</h3>
                     <h1 style="font-size: 3.5rem; color: {result_color} !important; margin: 10px 0;">{label}</h1>
                     <p>Confidence Score: <b>{confidence:.2%}</b></p>
+                    <p style="font-size: 0.85rem;">Latensi: <b>{latency_ms:.1f} ms</b></p>
                 </div>
                 """, unsafe_allow_html=True)
 
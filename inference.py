@@ -10,6 +10,7 @@ from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from sklearn.feature_extraction.text import CountVectorizer
 import io
+from functools import lru_cache
 
 # ==========================================
 # 1. KONFIGURASI & RESOURCE
@@ -24,6 +25,10 @@ DATA_PATH = os.path.join(BASE_DIR, "halodoc_reviews_labeled.csv")
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 MODEL_LOADED = False
 
+LABEL_MAP = {0: 'Negatif', 1: 'Netral', 2: 'Positif'}
+MAX_LENGTH = 128
+LIVE_CACHE_SIZE = 256 # Jumlah hasil prediksi live terakhir yang disimpan (LRU)
+
 # Kamus Normalisasi (Slang) - Lengkap
 NORMALISASI_KAMUS = {
     'yg': 'yang', 'gk': 'tidak', 'gak': 'tidak', 'ga': 'tidak', 'g': 'tidak',
@@ -93,6 +98,12 @@ def load_model():
         model.to(DEVICE)
         model.eval()
         
+        # Warm-up: satu forward pass agar prediksi pertama user tidak lambat
+        warmup_inputs = tokenizer("halodoc", return_tensors="pt")
+        warmup_inputs = {k: v.to(DEVICE) for k, v in warmup_inputs.items()}
+        with torch.no_grad():
+            model(**warmup_inputs)
+        
         MODEL_LOADED = True
         print("✅ Model berhasil dimuat!")
         return tokenizer, model
@@ -120,21 +131,16 @@ tokenizer, model = load_model()
 # ==========================================
 # 3. ENGINE PREDIKSI (SINGLE & BATCH)
 # ==========================================
-def predict_sentiment(text):
+@lru_cache(maxsize=LIVE_CACHE_SIZE)
+def _predict_clean_text(clean_text):
     """
-    Prediksi untuk satu kalimat (Live Prediction).
-    Output: Label, Confidence Score, List Probabilitas
+    Inferensi satu teks yang sudah dibersihkan (Cached LRU).
+    Tanpa padding ke max_length karena hanya ada satu input.
     """
-    if not MODEL_LOADED:
-        return "Error", 0.0, [0, 0, 0]
-    
-    clean_text = preprocess_text(text)
-    
     inputs = tokenizer(
         clean_text, 
         return_tensors="pt", 
-        max_length=128, 
-        padding="max_length", 
+        max_length=MAX_LENGTH, 
         truncation=True
     )
     inputs = {k: v.to(DEVICE) for k, v in inputs.items()}
@@ -145,8 +151,20 @@ def predict_sentiment(text):
         
     conf, pred = torch.max(probs, dim=1)
     
-    label_map = {0: 'Negatif', 1: 'Netral', 2: 'Positif'}
-    return label_map[pred.item()], conf.item(), probs.cpu().numpy()[0]
+    return LABEL_MAP[pred.item()], conf.item(), tuple(probs.cpu().numpy()[0])
+
+def predict_sentiment(text):
+    """
+    Prediksi untuk satu kalimat (Live Prediction).
+    Output: Label, Confidence Score, List Probabilitas
+    """
+    if not MODEL_LOADED:
+        return "Error", 0.0, [0, 0, 0]
+    
+    clean_text = preprocess_text(text)
+    
+    label, conf, probs = _predict_clean_text(clean_text)
+    return label, conf, np.array(probs)
 
 @st.cache_data(show_spinner=False)
 def predict_batch(df, text_column):
@@ -179,7 +197,7 @@ def predict_batch(df, text_column):
         inputs = tokenizer(
             batch_texts, 
             return_tensors="pt", 
-            max_length=128, 
+            max_length=MAX_LENGTH, 
             padding=True, 
             truncation=True
         )
@@ -190,9 +208,7 @@ def predict_batch(df, text_column):
             probs = F.softmax(outputs.logits, dim=1)
             conf, pred = torch.max(probs, dim=1)
             
-        label_map = {0: 'Negatif', 1: 'Netral', 2: 'Positif'}
-        
-        labels.extend([label_map[p.item()] for p in pred])
+        labels.extend([LABEL_MAP[p.item()] for p in pred])
         confidences.extend([c.item() for c in conf])
         
     # 3. Simpan Hasil